@@ -0,0 +1,129 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+#######################################################################################
+# Cython compiled backtracking kernel used by the Sudoku solver in non interactive mode.
+# Same interface and algorithm as the Numba kernel in _solve_numba.py, build in place
+# with: cythonize -i _solve_cython.pyx
+#
+# @module:    _solve_cython
+# @requires:  cython (build only)
+# @author:    cwsoft
+# @python:    3.8 or higher
+#######################################################################################
+"""
+# Upper bound of candidate removals (and forced singles) on the search path: 81 placements with 20 peers each.
+cdef enum:
+    _MAX_REMOVED = 81 * 20
+
+MAX_REMOVED = _MAX_REMOVED
+
+# PEERS, POPCOUNT and NUMBER_OF_BIT lookup tables of sudoku.py as static C arrays.
+cdef signed char PEERS[81][20]
+cdef signed char POPCOUNT[512]
+cdef signed char NUMBER_OF_BIT[512]
+
+
+def _init_tables():
+    """Fill the C lookup tables once on module import."""
+    cell_info = [(idx // 9, idx % 9, (idx // 27) * 3 + (idx % 9) // 3) for idx in range(81)]
+    for idx in range(81):
+        peers = [peer for peer in range(81) if peer != idx and any(a == b for a, b in zip(cell_info[peer], cell_info[idx]))]
+        for pos, peer in enumerate(peers):
+            PEERS[idx][pos] = peer
+
+    for mask in range(512):
+        POPCOUNT[mask] = bin(mask).count("1")
+        NUMBER_OF_BIT[mask] = mask.bit_length() if mask & (mask - 1) == 0 else 0
+
+
+_init_tables()
+
+
+cdef inline int select_free_slot(signed char[:] board, int[:] options, signed char[:] empties, int *best_cand):
+    """Return free slot with fewest candidates (MRV heuristic), its candidates are stored in best_cand."""
+    cdef int pos, idx, cand, count, best_slot = 0, best_count = 10
+    best_cand[0] = 0
+    for pos in range(empties.shape[0]):
+        idx = empties[pos]
+        if board[idx] == 0:
+            cand = options[idx]
+            count = POPCOUNT[cand]
+            if count < best_count:
+                best_slot, best_cand[0], best_count = idx, cand, count
+                if count <= 2:
+                    break
+
+    return best_slot
+
+
+def solve(signed char[:] board, int[:] options, signed char[:] empties, signed char[:] slots, int[:] candidates,
+          int[:, :] marks, signed char[:] placed, int[:] removed, long long[:] state):
+    """Continue search stored in state=[depth, forward, placed, removed, steps].
+
+    Returns True on the next solution and False if the search tree is exhausted. Undo log entries in removed are
+    packed as slot * 512 + bit, marks[depth] holds the undo log sizes before the first attempt at each depth.
+    """
+    cdef int forced[_MAX_REMOVED]
+    cdef int depth = state[0], forward = state[1], n_placed = state[2], n_removed = state[3]
+    cdef int n_empty = empties.shape[0], n_forced, idx, peer, pos, cand, bit
+    cdef bint consistent
+
+    while depth >= 0:
+        if forward:
+            if n_placed == n_empty:
+                # Resume with the next candidate of the last branch on the following call.
+                state[0], state[1], state[2], state[3] = depth - 1, 0, n_placed, n_removed
+                return True
+            slots[depth] = select_free_slot(board, options, empties, &cand)
+            candidates[depth] = cand
+            marks[depth, 0], marks[depth, 1] = n_placed, n_removed
+
+        # Undo all placements and candidate removals of a previous attempt at this depth.
+        while n_placed > marks[depth, 0]:
+            n_placed -= 1
+            board[placed[n_placed]] = 0
+        while n_removed > marks[depth, 1]:
+            n_removed -= 1
+            options[removed[n_removed] >> 9] |= removed[n_removed] & 0x1FF
+
+        # Go one level back if no further number can be placed in the branch slot.
+        cand = candidates[depth]
+        if cand == 0:
+            depth, forward = depth - 1, 0
+            continue
+
+        # Place lowest remaining candidate number and propagate it to the peers (including forced singles).
+        bit = cand & -cand
+        candidates[depth] = cand ^ bit
+        forced[0], n_forced, consistent = slots[depth] * 512 + bit, 1, True
+        while n_forced > 0 and consistent:
+            n_forced -= 1
+            idx, bit = forced[n_forced] >> 9, forced[n_forced] & 0x1FF
+            if board[idx]:
+                continue
+            board[idx] = NUMBER_OF_BIT[bit]
+            placed[n_placed] = idx
+            n_placed += 1
+            state[4] += 1
+
+            for pos in range(20):
+                peer = PEERS[idx][pos]
+                if options[peer] & bit and board[peer] == 0:
+                    options[peer] ^= bit
+                    removed[n_removed] = peer * 512 + bit
+                    n_removed += 1
+                    if options[peer] == 0:
+                        consistent = False
+                        break
+                    if options[peer] & (options[peer] - 1) == 0:
+                        forced[n_forced] = peer * 512 + options[peer]
+                        n_forced += 1
+
+        # Branch on the next free slot, or retry this depth with the next candidate after a contradiction.
+        if consistent:
+            depth, forward = depth + 1, 1
+        else:
+            forward = 0
+
+    state[0], state[1], state[2], state[3] = depth, forward, n_placed, n_removed
+    return False
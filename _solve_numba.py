@@ -0,0 +1,112 @@
+"""
+#######################################################################################
+# Numba compiled backtracking kernel used by the Sudoku solver in non interactive mode.
+# Mirrors the candidate propagation and MRV search of Sudoku._backtrack on numpy arrays.
+#
+# @module:    _solve_numba
+# @requires:  numba, numpy
+# @author:    cwsoft
+# @python:    3.8 or higher
+#######################################################################################
+"""
+import numpy as np
+from numba import njit
+
+# PEERS, POPCOUNT and NUMBER_OF_BIT lookup tables of sudoku.py as numpy arrays.
+_CELL_INFO = [(idx // 9, idx % 9, (idx // 27) * 3 + (idx % 9) // 3) for idx in range(81)]
+PEERS = np.array(
+    [
+        [peer for peer in range(81) if peer != idx and any(a == b for a, b in zip(_CELL_INFO[peer], _CELL_INFO[idx]))]
+        for idx in range(81)
+    ],
+    dtype=np.int8,
+)
+POPCOUNT = np.array([bin(mask).count("1") for mask in range(512)], dtype=np.int8)
+NUMBER_OF_BIT = np.array([mask.bit_length() if mask & (mask - 1) == 0 else 0 for mask in range(512)], dtype=np.int8)
+
+# Upper bound of candidate removals (and forced singles) on the search path: 81 placements with 20 peers each.
+MAX_REMOVED = 81 * 20
+
+
+@njit(cache=True, boundscheck=False)
+def select_free_slot(board, options, empties):
+    """Return (slot, candidates) of the free slot with fewest candidates (MRV heuristic)."""
+    best_slot, best_cand, best_count = 0, 0, 10
+    for idx in empties:
+        if board[idx] == 0:
+            cand = options[idx]
+            count = POPCOUNT[cand]
+            if count < best_count:
+                if count <= 2:
+                    return idx, cand
+                best_slot, best_cand, best_count = idx, cand, count
+
+    return best_slot, best_cand
+
+
+@njit(cache=True, boundscheck=False)
+def solve(board, options, empties, slots, candidates, marks, placed, removed, state):
+    """Continue search stored in state=[depth, forward, placed, removed, steps].
+
+    Returns True on the next solution and False if the search tree is exhausted. Undo log entries in removed are
+    packed as slot * 512 + bit, marks[depth] holds the undo log sizes before the first attempt at each depth.
+    """
+    forced = np.empty(MAX_REMOVED, dtype=np.int32)
+    depth, forward, n_placed, n_removed = state[0], state[1], state[2], state[3]
+    while depth >= 0:
+        if forward:
+            if n_placed == len(empties):
+                # Resume with the next candidate of the last branch on the following call.
+                state[0], state[1], state[2], state[3] = depth - 1, 0, n_placed, n_removed
+                return True
+            slots[depth], candidates[depth] = select_free_slot(board, options, empties)
+            marks[depth, 0], marks[depth, 1] = n_placed, n_removed
+
+        # Undo all placements and candidate removals of a previous attempt at this depth.
+        while n_placed > marks[depth, 0]:
+            n_placed -= 1
+            board[placed[n_placed]] = 0
+        while n_removed > marks[depth, 1]:
+            n_removed -= 1
+            options[removed[n_removed] >> 9] |= removed[n_removed] & 0x1FF
+
+        # Go one level back if no further number can be placed in the branch slot.
+        cand = candidates[depth]
+        if cand == 0:
+            depth, forward = depth - 1, 0
+            continue
+
+        # Place lowest remaining candidate number and propagate it to the peers (including forced singles).
+        bit = cand & -cand
+        candidates[depth] = cand ^ bit
+        forced[0], n_forced, consistent = slots[depth] * 512 + bit, 1, True
+        while n_forced > 0 and consistent:
+            n_forced -= 1
+            idx, bit = forced[n_forced] >> 9, forced[n_forced] & 0x1FF
+            if board[idx]:
+                continue
+            board[idx] = NUMBER_OF_BIT[bit]
+            placed[n_placed] = idx
+            n_placed += 1
+            state[4] += 1
+
+            for peer in PEERS[idx]:
+                if options[peer] & bit and board[peer] == 0:
+                    options[peer] ^= bit
+                    removed[n_removed] = peer * 512 + bit
+                    n_removed += 1
+                    if options[peer] == 0:
+                        consistent = False
+                        break
+                    if options[peer] & (options[peer] - 1) == 0:
+                        forced[n_forced] = peer * 512 + options[peer]
+                        n_forced += 1
+
+        # Branch on the next free slot, or retry this depth with the next candidate after a contradiction.
+        if consistent:
+            depth, forward = depth + 1, 1
+        else:
+            forward = 0
+
+    state[0], state[1], state[2], state[3] = depth, forward, n_placed, n_removed
+    return False
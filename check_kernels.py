@@ -0,0 +1,74 @@
+"""
+#######################################################################################
+# Parity check of the optional compiled solver kernels against the Python solver.
+# Solves each puzzle in puzzles/*.txt with every installed kernel and compares the
+# solutions and iteration steps with those of the pure Python solver.
+#
+# @module:    check_kernels
+# @requires:  csutils.cterm, numpy (optional: compiled _solve_cython or numba)
+# @author:    cwsoft
+# @python:    3.8 or higher
+#######################################################################################
+"""
+import argparse
+import contextlib
+import glob
+import importlib
+import io
+import os
+import sys
+
+import sudoku
+
+# Compiled solver kernels compared with the Python solver, kernels not installed (or not built) are skipped.
+KERNELS = ("_solve_cython", "_solve_numba")
+
+# Maximal number of solutions compared per puzzle (e.g. the empty puzzle has a huge number of solutions).
+MAX_SOLUTIONS = 100
+
+
+def solve(puzzlefile, solve_kernel=None):
+    """Return (solution, iteration steps) pairs found by the Python solver or the specified kernel module."""
+    args = argparse.Namespace(puzzlefile=puzzlefile, space=".", interactive=False, compiled=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        puzzle = sudoku.Sudoku(args)
+
+    # Mirror Sudoku.solve_puzzle: fill naked singles first, then backtrack on the remaining free slots.
+    if puzzle._propagate_singles() is None:
+        return []
+
+    solver = puzzle._backtrack() if solve_kernel is None else puzzle._backtrack_compiled(solve_kernel)
+    results = []
+    for _ in solver:
+        results.append((bytes(puzzle.cells), puzzle.iteration_steps))
+        puzzle.iteration_steps = 0
+        if len(results) == MAX_SOLUTIONS:
+            break
+
+    return results
+
+
+def main():
+    """Compare all installed kernels with the Python solver, returns exit code 1 on any mismatch."""
+    kernels = []
+    for name in KERNELS:
+        try:
+            kernels.append((name, importlib.import_module(name)))
+        except ImportError:
+            print(f"{name}: not installed, skipped.")
+
+    mismatches = 0
+    puzzle_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "puzzles")
+    for puzzlefile in sorted(glob.glob(os.path.join(puzzle_dir, "*.txt"))):
+        expected = solve(puzzlefile)
+        steps = sum(step for _, step in expected)
+        for name, kernel in kernels:
+            status = "OK" if solve(puzzlefile, kernel) == expected else "MISMATCH"
+            mismatches += status != "OK"
+            print(f"{os.path.basename(puzzlefile)}: {name} {status} ({len(expected)} solution(s), {steps} steps)")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
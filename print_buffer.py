@@ -0,0 +1,134 @@
+"""
+#######################################################################################
+# Buffers all output written to sys.stdout in memory and passes it to the real stdout
+# in large chunks, reducing the number of write calls to the terminal.
+#
+# @module:    print_buffer
+# @author:    cwsoft
+# @python:    3.8 or higher
+#######################################################################################
+"""
+import io
+import os
+import sys
+
+
+class PrintBuffer:
+    """Context manager redirecting sys.stdout into a StringIO, flushed on threshold, flush() and exit.
+
+    Output only reaches the terminal on flush, so callers must flush at each frame the user should see
+    (prompts and interactive board updates), the threshold just bounds the memory used between two frames.
+    """
+
+    def __init__(self, threshold=64 * 1024):
+        self.threshold = threshold
+        self._buffer, self._stdout, self._fileno, self._console = io.StringIO(), None, None, None
+
+    def __enter__(self):
+        self._stdout, sys.stdout = sys.stdout, self
+        try:
+            self._fileno = self._stdout.fileno()
+        except (AttributeError, OSError):
+            # Stream without file descriptor (e.g. StringIO or IDE console), fall back to its write method.
+            self._fileno = None
+
+        # Write directly to the Windows console with WriteConsoleW if stdout is not redirected.
+        if self._fileno == 1:
+            self._console = _WinConsoleSink.open()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+        sys.stdout = self._stdout
+        return False
+
+    def __getattr__(self, name):
+        # Delegate everything else (encoding, fileno, isatty...) to the real stdout, so input() keeps working.
+        return getattr(self._stdout, name)
+
+    def write(self, text):
+        """Append text to the buffer and pass buffer to the real stdout once it exceeds the threshold."""
+        size = self._buffer.write(text)
+        if self._buffer.tell() > self.threshold:
+            self.flush()
+        return size
+
+    def flush(self):
+        """Write buffered text to the real stdout with a single call, callers flush at frame boundaries."""
+        if self._buffer.tell():
+            self._write(self._buffer.getvalue())
+            self._buffer.seek(0)
+            self._buffer.truncate()
+        self._stdout.flush()
+
+    def _write(self, text):
+        """Pass ASCII text (ANSI sequences and digits) as bytes to the stdout file descriptor via os.write."""
+        if self._console is not None:
+            self._stdout.flush()
+            self._console.write(text)
+            return
+
+        try:
+            data = text.encode("ascii")
+        except UnicodeEncodeError:
+            data = None
+
+        if self._fileno is None or data is None:
+            # Let the text stream handle encoding (e.g. non ASCII puzzle file names) or missing file descriptors.
+            self._stdout.write(text)
+            return
+
+        # Flush text written to the real stdout before, then write all bytes (os.write may write partially).
+        self._stdout.flush()
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fileno, view):]
+
+
+def win_console():
+    """Return (kernel32, handle, mode) of the Windows console of stdout, None if stdout is no console or not Windows."""
+    if sys.platform != "win32":
+        return None
+
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32
+    handle, mode = kernel32.GetStdHandle(-11), ctypes.c_ulong()
+    if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        return None
+    return kernel32, handle, mode.value
+
+
+class _WinConsoleSink:
+    """Writes text to the Windows console handle of stdout as UTF-16 with WriteConsoleW."""
+
+    # Number of chars (code points) passed per WriteConsoleW call, at most twice as many UTF-16 code units
+    # (older consoles reject large buffers). Slicing the text keeps surrogate pairs within one call.
+    CHUNK_SIZE = 8 * 1024
+
+    def __init__(self, kernel32, handle):
+        import ctypes
+
+        # Number of UTF-16 code units written by the last call, reused by all calls.
+        self._kernel32, self._handle, self._written = kernel32, handle, ctypes.c_ulong()
+        self._written_ref = ctypes.byref(self._written)
+
+    @classmethod
+    def open(cls):
+        """Return a console sink for stdout, or None if stdout is no console (e.g. redirected to a file or pipe)."""
+        console = win_console()
+        return None if console is None else cls(*console[:2])
+
+    def write(self, text):
+        """Write text to the console, WriteConsoleW handles all Unicode chars (no code page encoding)."""
+        for pos in range(0, len(text), self.CHUNK_SIZE):
+            data = text[pos : pos + self.CHUNK_SIZE].encode("utf-16-le")
+            # WriteConsoleW may write less than requested, continue until all code units are written.
+            while data:
+                if not self._kernel32.WriteConsoleW(self._handle, data, len(data) // 2, self._written_ref, None):
+                    import ctypes
+
+                    raise ctypes.WinError()
+                if not self._written.value:
+                    raise OSError("WriteConsoleW wrote no chars to the console")
+                data = data[2 * self._written.value :]
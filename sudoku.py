@@ -5,137 +5,446 @@
 #
 # @module:    sudoku
 # @platform:  Windows OS (tested with Windows 10 only)
-# @requires:  csutils.cterm, pandas
+# @requires:  csutils.cterm, numpy (optional: compiled _solve_cython or numba)
 # @author:    cwsoft
 # @python:    3.8 or higher
 #######################################################################################
 """
 import argparse
 import sys
+import time
 
-import pandas as pd
-from csutils.cterm import Colors, Styles, Cursor, Terminal
+import numpy as np
+from csutils.cterm import Colors, Styles, Terminal
+
+from print_buffer import PrintBuffer, win_console
+
+
+def import_solve_kernel():
+    """Import optional compiled solver kernel on first use (numba import alone takes ~0.35s), None if unavailable."""
+    try:
+        # Optional solver kernel built with Cython (cythonize -i _solve_cython.pyx), starts faster than Numba.
+        import _solve_cython as solve_kernel
+    except ImportError:
+        try:
+            # Optional Numba compiled solver kernel, used if the numba package is installed.
+            import _solve_numba as solve_kernel
+        except ImportError:
+            solve_kernel = None
+    return solve_kernel
+
+
+# The compiled kernels (_solve_numba.py, _solve_cython.pyx) keep own copies of PEERS, POPCOUNT and NUMBER_OF_BIT and a
+# port of _backtrack. Keep them in sync, check_kernels.py compares their solutions and steps with the Python solver.
+
+# Row, column and 3x3 box index of each of the 81 board slots (row-major order).
+CELL_INFO = tuple((idx // 9, idx % 9, (idx // 27) * 3 + (idx % 9) // 3) for idx in range(81))
+
+# The 20 peer slots sharing a row, column or 3x3 box with each of the 81 board slots.
+PEERS = tuple(
+    tuple(peer for peer in range(81) if peer != idx and any(a == b for a, b in zip(CELL_INFO[peer], CELL_INFO[idx])))
+    for idx in range(81)
+)
+
+# Terminal row/col of the 9x9 board slots: rows skip the puzzle file line and a border line per 3x3 box,
+# columns use two chars per slot plus the box borders.
+ROW_MAP = tuple(3 + row + row // 3 for row in range(9))
+COL_MAP = tuple(3 + 2 * col + 2 * (col // 3) for col in range(9))
+
+# Precomputed ANSI sequences to store and restore the cursor position, to set the foreground color, to reset
+# colors and cursor after painting a slot and to hide or show the cursor.
+CURSOR_SAVE, CURSOR_LOAD = "\033[s", "\033[u"
+SET_FORECOLOR = {color: f"\033[{color.value}m" for color in Colors}
+RESET_FORECOLOR = SET_FORECOLOR[Colors.RESET]
+RESET_COLOR_AND_CURSOR = f"\033[{Colors.RESET.value}m{CURSOR_LOAD}"
+CURSOR_DISABLE, CURSOR_ENABLE = "\033[?25l", "\033[?25h"
+
+# Builders for parameterized cursor moves (bound str.format, no escape code lookup or parsing per call).
+cursor_to, cursor_up, cursor_down = "\033[{};{}f".format, "\033[{}A".format, "\033[{}B".format
+cursor_right = "\033[{}C".format
+
+# Cursor position sequence of each of the 81 board slots.
+SLOT_CURSOR = tuple(cursor_to(ROW_MAP[row], COL_MAP[col]) for row, col, _ in CELL_INFO)
+
+# Single SGR sequence resetting style, foreground and background color at once (CSI style;fg;bg m).
+RESET_ATTRIBUTES = f"\033[{Styles.RESET.value};{Colors.RESET.value};{Colors.RESET.value + 10}m"
+
+# Minimal time in seconds between two interactive board redraws, slot changes in between are coalesced.
+REDRAW_INTERVAL = 0.005
+
+# Number of candidates encoded in a 9-bit mask (int.bit_count requires Python 3.10+).
+POPCOUNT = tuple(bin(mask).count("1") for mask in range(512))
+
+# Number encoded by a single candidate bit (1 << (number - 1)), avoids a bit_length() call per placed number.
+NUMBER_OF_BIT = tuple(mask.bit_length() if mask & (mask - 1) == 0 else 0 for mask in range(512))
+
+
+class _Stop(Exception):
+    """Raised by the solver if the user declines to check for another solution."""
 
 
 class Sudoku:
     def __init__(self, args):
         # Extract required and optional command line arguments.
         self.puzzlefile, self.space, self.interactive = args.puzzlefile, args.space, args.interactive
+        self.compiled = args.compiled
 
         # Read Sudoku puzzle file and draw initial board to terminal.
         self.read_puzzle_file(self.puzzlefile)
         self.print_board()
 
     def read_puzzle_file(self, puzzlefile):
-        # Read Sudoku puzzle file and store board as 9x9 Numpy matrix.
-        self.board_input = pd.read_csv(puzzlefile, sep=" ", comment="#", dtype="byte", header=None).to_numpy()
+        # Read Sudoku puzzle file (ignoring comments and blank lines) and store board as 9x9 Numpy matrix.
+        # Plain line splitting avoids the overhead of np.loadtxt for a file with just 81 numbers.
+        with open(puzzlefile) as f:
+            rows = [fields for fields in (line.split("#", 1)[0].split() for line in f) if fields]
+        self.board_input = np.array(rows, dtype=np.int8)
         assert self.board_input.shape == (9, 9)
 
-        self.board, self.board_last_solution = self.board_input.copy(), None
+        self.board_last_solution = None
         self.solutions_found, self.iteration_steps = 0, 0
 
+        # Interactive mode collects changed slots (slot index -> number) and redraws them on a timer.
+        self._dirty, self._next_redraw = {}, 0.0
+
+        # Precomputed color sequence of each slot: input numbers are highlighted green.
+        self.slot_colors = [SET_FORECOLOR[Colors.GREEN if number > 0 else Colors.RESET] for number in self.board_input.flat]
+
+        # Flat solver board with 9-bit masks of the numbers already used in each row, column and 3x3 box.
+        self.cells = [int(number) for number in self.board_input.flat]
+        self.rows, self.cols, self.boxes = [0] * 9, [0] * 9, [0] * 9
+        for idx, number in enumerate(self.cells):
+            if number > 0:
+                row, col, box = CELL_INFO[idx]
+                bit = 1 << (number - 1)
+                self.rows[row] |= bit
+                self.cols[col] |= bit
+                self.boxes[box] |= bit
+
     def print_board(self):
         """Print Sudoku input board as 9x9 matrix to terminal with input numbers highlighted green."""
         tpl_border = "|-+-+-+-|-+-+-+-|-+-+-+-|"
         tpl_values = "| {0} {0} {0} | {0} {0} {0} | {0} {0} {0} |"
 
-        # Output puzzle file name and draw the initial empty board.
-        print(f"Puzzle file: '{self.puzzlefile}'")
-        for row in range(0, 9):
-            if row % 3 == 0:
-                print(tpl_border)
-            print(tpl_values.format(self.space))
-        print(tpl_border)
+        # Output puzzle file name and draw the initial empty board with a single write.
+        values = tpl_values.format(self.space)
+        box_rows = "\n".join([tpl_border, values, values, values])
+        sys.stdout.write("\n".join([f"Puzzle file: '{self.puzzlefile}'", box_rows, box_rows, box_rows, tpl_border]) + "\n")
+
+        # Numbers currently shown in the terminal slots (shadow buffer), unchanged slots are not written again.
+        self._shown = [self.space] * 81
 
         # Fill input numbers from puzzle file into right board slots.
-        self.set_board_numbers(inputs_only=True)
+        self.set_board_numbers(board=self.board_input, inputs_only=True)
 
-    def set_board_numbers(self, board=None, inputs_only=True):
+    def set_board_numbers(self, board, inputs_only=True):
         """Fill board with numbers from specified board. Input numbers are highlighted green."""
-        board = self.board if board is None else board
-        for row in range(9):
-            for col in range(9):
-                if self.board_input[row, col] > 0:
-                    number = self.board_input[row, col]
-                    self._set_board_number(number, row, col, forecolor=Colors.GREEN)
-                else:
-                    number = self.space if inputs_only else board[row, col]
-                    self._set_board_number(number, row, col, forecolor=Colors.RESET)
+        # Read numbers from flat lists, numpy scalar indexing is much slower than list indexing.
+        board = board.ravel().tolist()
+        board_input = self.board_input.ravel().tolist()
+        numbers = [
+            number_input if number_input > 0 else self.space if inputs_only else number
+            for number, number_input in zip(board, board_input)
+        ]
+        self._write_slots(enumerate(numbers))
 
     def solve_puzzle(self):
-        """Solve Sudoku puzzle using backtracking algortithm."""
+        """Solve Sudoku puzzle using an iterative backtracking algorithm on row, column and box bitmasks."""
         # Disable cursor to avoid flickering when in interactive mode.
         if self.interactive:
-            Cursor.disable()
-
-        for row in range(9):
-            for col in range(9):
-                # Find first free slot in the board.
-                if self.board[row][col] == 0:
-                    # Find first number which can be placed in free board slot.
-                    for number in range(1, 10):
-                        if self._board_position_possible(number, row, col):
-                            # Update free slot with actual number.
-                            self.board[row, col] = number
-                            if self.interactive:
-                                self._set_board_number(number, row, col)
-
-                            # Try to solve the board with the added number.
-                            self.iteration_steps += 1
-                            self.solve_puzzle()
-
-                            # Reset last assigned number as no solution was found.
-                            self.board[row, col] = 0
-                            if self.interactive:
-                                self._set_board_number(self.space, row, col)
-                    return
-
-        # Solver found a solution.
+            sys.stdout.write(CURSOR_DISABLE)
+
+        # Fill all forced numbers before backtracking. A free slot without candidates means there is no solution.
+        singles = self._propagate_singles()
+        if singles is None:
+            self._redraw_dirty(force=True)
+            return
+
+        # The compiled kernel is opt-in (--compiled): importing it costs more than the Python solver needs for
+        # typical puzzles. It can´t update the terminal, so interactive mode always uses the Python solver.
+        use_kernel = self.compiled and not self.interactive and 0 in self.cells
+        solve_kernel = import_solve_kernel() if use_kernel else None
+        solver = self._backtrack() if solve_kernel is None else self._backtrack_compiled(solve_kernel)
+        for _ in solver:
+            # Solver found a solution. Snapshot the flat solver cells as 81 bytes (numbers fit into a byte).
+            solution = bytes(self.cells)
+            if self.interactive:
+                sys.stdout.write(CURSOR_ENABLE)
+            else:
+                # Show the solution, only slots differing from the numbers already shown are repainted.
+                self.set_board_numbers(board=self.solution_board(solution), inputs_only=False)
+
+            # Store actual solution in case next run won´t find a new solution.
+            # In this case we can print the last known solution in the main program.
+            self.board_last_solution = solution
+            self.solutions_found += 1
+
+            # Prompt user if we should check for another possible solution.
+            print(f"Number of Iterations: {self.iteration_steps}" + " " * 15)
+            sys.stdout.flush()
+            if input("Check for another solution ([y]/n)? ").lower() == "n":
+                print(f"\nSolver stopped on user request. Found {self.solutions_found} solution(s).")
+                raise _Stop
+
+            # Move cursor two lines up so next solution overwrites last two output lines instead of adding new lines.
+            # Adding new lines would shift the board in the terminal and mess up with adding numbers to right spot.
+            sys.stdout.write(cursor_up(2))
+
+            # Reset number of iterations for the next solution.
+            self.iteration_steps = 0
+            if self.interactive:
+                sys.stdout.write(CURSOR_DISABLE)
+
+        # Search tree is exhausted and all solver moves are undone again.
+        self._remove_numbers(singles)
+        self._redraw_dirty(force=True)
+
+    @staticmethod
+    def solution_board(solution):
+        """Return a bytes solution snapshot as read-only 9x9 Numpy matrix view for display."""
+        return np.frombuffer(solution, dtype=np.int8).reshape(9, 9)
+
+    def _propagate_singles(self):
+        """Repeatedly place numbers into free slots with a single candidate (naked singles) until none is left.
+
+        Returns the list of filled slots, or None (with all placements undone) if a free slot has no candidate.
+        """
+        cells, rows, cols, boxes = self.cells, self.rows, self.cols, self.boxes
+        singles, changed = [], True
+        while changed:
+            changed = False
+            for idx in range(81):
+                if cells[idx]:
+                    continue
+
+                row, col, box = CELL_INFO[idx]
+                cand = ~(rows[row] | cols[col] | boxes[box]) & 0x1FF
+                if not cand:
+                    self._remove_numbers(singles)
+                    return None
+
+                if cand & (cand - 1) == 0:
+                    self._place_number(idx, NUMBER_OF_BIT[cand])
+                    singles.append(idx)
+                    changed = True
+
+        return singles
+
+    def _place_number(self, idx, number):
+        """Place number into free board slot idx and mark it as used in the row, column and box bitmasks."""
+        row, col, box = CELL_INFO[idx]
+        bit = 1 << (number - 1)
+        self.cells[idx] = number
+        self.rows[row] |= bit
+        self.cols[col] |= bit
+        self.boxes[box] |= bit
+        self.iteration_steps += 1
         if self.interactive:
-            Cursor.enable()
-        else:
-            # Show all board numbers of the actual solution.
-            self.set_board_numbers(inputs_only=False)
-
-        # Store actual solution in case next run won´t find a new solution.
-        # In this case we can print the last known solution in the main program.
-        self.board_last_solution = self.board.copy()
-        self.solutions_found += 1
-
-        # Prompt user if we should check for another possible solution.
-        print(f"Number of Iterations: {self.iteration_steps}" + " " * 15)
-        if input("Check for another solution ([y]/n)? ").lower() == "n":
-            print(f"\nSolver stopped on user request. Found {self.solutions_found} solution(s).")
-            sys.exit()
-
-        # Move cursor two lines up so next solution overwrites last two output lines instead of adding new lines.
-        # Adding new lines would shift the board in the terminal and mess up with adding numbers to right spot.
-        Cursor.up(pos=2)
-
-        # Reset number of iterations for the next solution.
-        self.iteration_steps = 0
-
-    def _set_board_number(self, number, row, col, forecolor=None):
-        """Transfer 9x9 row/col indices into terminal coordinates matching the initial empty board."""
-        row_map = {0: 3, 1: 4, 2: 5, 3: 7, 4: 8, 5: 9, 6: 11, 7: 12, 8: 13}
-        col_map = {0: 3, 1: 5, 2: 7, 3: 11, 4: 13, 5: 15, 6: 19, 7: 21, 8: 23}
-
-        Terminal.write(number, row_map.get(row), col_map.get(col), forecolor, auto_reset=True)
-
-    def _board_position_possible(self, number, row, col):
-        """Check if number can be placed at given board[row][col] position."""
-
-        # Check if given number already exists within the specified board row or column.
-        if number in self.board[row, :] or number in self.board[:, col]:
-            return False
-
-        # Check if number already exists within 3x3 quadrant given by row/col index.
-        row_idx, col_idx = (row // 3) * 3, (col // 3) * 3
-        if number in self.board[row_idx : row_idx + 3, col_idx : col_idx + 3].flatten():
-            return False
-
-        # Number can be placed at board[row][col] slot.
-        return True
+            self._dirty[idx] = number
+
+    def _remove_numbers(self, slots):
+        """Remove numbers placed into the given board slots in reverse order and clear them from the bitmasks."""
+        for idx in reversed(slots):
+            row, col, box = CELL_INFO[idx]
+            bit = 1 << (self.cells[idx] - 1)
+            self.cells[idx] = 0
+            self.rows[row] ^= bit
+            self.cols[col] ^= bit
+            self.boxes[box] ^= bit
+            if self.interactive:
+                self._dirty[idx] = self.space
+
+    def _backtrack(self):
+        """Generator placing numbers into the free slots, yields each time the board is completely solved.
+
+        Each placement removes its number from the candidates of all free peer slots. Peers left with a single
+        candidate are filled right away (naked singles), a peer without candidates fails the placement.
+        """
+        cells = self.cells
+        empties = [idx for idx in range(81) if cells[idx] == 0]
+        options = self._candidate_options()
+        select_free_slot = self._compile_slot_selector(empties)
+
+        # Bind attributes and globals used in the search loop to locals (LOAD_FAST instead of attribute lookups).
+        n_empty, peers, number_of_bit, space = len(empties), PEERS, NUMBER_OF_BIT, self.space
+        dirty, redraw_dirty = (self._dirty, self._redraw_dirty) if self.interactive else (None, None)
+        steps = 0
+
+        # Explicit search stack: slots[depth] is the free slot branched on at each depth, candidates[depth] are its
+        # remaining candidate numbers and marks[depth] the undo log sizes before the first attempt at this depth.
+        # The undo logs hold all filled slots and all (slot, bit) candidates removed from peers in placing order.
+        slots, candidates, marks = [0] * n_empty, [0] * n_empty, [(0, 0)] * n_empty
+        placed, removed = [], []
+        depth, forward = 0, True
+        while depth >= 0:
+            if dirty:
+                redraw_dirty()
+
+            if forward:
+                if len(placed) == n_empty:
+                    # All free slots are filled. Continue with the next candidate of the last branch afterwards.
+                    if dirty:
+                        redraw_dirty(force=True)
+                    self.iteration_steps += steps
+                    steps = 0
+                    yield
+                    depth, forward = depth - 1, False
+                    continue
+                slots[depth], candidates[depth] = select_free_slot(cells, options)
+                marks[depth] = (len(placed), len(removed))
+
+            # Undo all placements and candidate removals of a previous attempt at this depth.
+            n_placed, n_removed = marks[depth]
+            while len(placed) > n_placed:
+                idx = placed.pop()
+                cells[idx] = 0
+                if dirty is not None:
+                    dirty[idx] = space
+            while len(removed) > n_removed:
+                idx, bit = removed.pop()
+                options[idx] |= bit
+
+            # Go one level back if no further number can be placed in the branch slot.
+            cand = candidates[depth]
+            if not cand:
+                depth, forward = depth - 1, False
+                continue
+
+            # Place lowest remaining candidate number and propagate it to the peers (including forced singles).
+            bit = cand & -cand
+            candidates[depth] = cand ^ bit
+            forced, consistent = [(slots[depth], bit)], True
+            while forced and consistent:
+                idx, bit = forced.pop()
+                if cells[idx]:
+                    continue
+                cells[idx] = number_of_bit[bit]
+                placed.append(idx)
+                steps += 1
+                if dirty is not None:
+                    dirty[idx] = cells[idx]
+
+                for peer in peers[idx]:
+                    if options[peer] & bit and not cells[peer]:
+                        options[peer] ^= bit
+                        removed.append((peer, bit))
+                        if not options[peer]:
+                            consistent = False
+                            break
+                        if options[peer] & (options[peer] - 1) == 0:
+                            forced.append((peer, options[peer]))
+
+            # Branch on the next free slot, or retry this depth with the next candidate after a contradiction.
+            if consistent:
+                depth, forward = depth + 1, True
+            else:
+                forward = False
+
+        self.iteration_steps += steps
+
+    @staticmethod
+    def _compile_slot_selector(empties):
+        """Generate MRV selector returning (slot, candidates) of the free slot with fewest candidates.
+
+        The scan over the puzzle´s free slots is unrolled with each slot index inlined as constant, so the search
+        loop does no list iteration to find the next slot (partial evaluation).
+        """
+        lines = ["def select_free_slot(cells, options):", "    best_slot, best_cand, best_count = 0, 0, 10"]
+        for idx in empties:
+            lines += [
+                f"    if not cells[{idx}]:",
+                f"        cand = options[{idx}]",
+                "        count = POPCOUNT[cand]",
+                "        if count < best_count:",
+                "            # Forced singles are placed by the propagation, so two candidates can´t be beaten.",
+                "            if count <= 2:",
+                f"                return {idx}, cand",
+                f"            best_slot, best_cand, best_count = {idx}, cand, count",
+            ]
+        lines.append("    return best_slot, best_cand")
+
+        namespace = {"POPCOUNT": POPCOUNT}
+        exec("\n".join(lines), namespace)
+        return namespace["select_free_slot"]
+
+    def _backtrack_compiled(self, solve_kernel):
+        """Generator running the compiled solver kernel, yields each time the board is completely solved."""
+        board, options = np.array(self.cells, dtype=np.int8), np.array(self._candidate_options(), dtype=np.int32)
+        empties = np.flatnonzero(board == 0).astype(np.int8)
+        slots, candidates = np.zeros(len(empties), dtype=np.int8), np.zeros(len(empties), dtype=np.int32)
+        marks, placed = np.zeros((len(empties), 2), dtype=np.int32), np.zeros(81, dtype=np.int8)
+        removed = np.zeros(solve_kernel.MAX_REMOVED, dtype=np.int32)
+        state = np.array([0, 1, 0, 0, 0], dtype=np.int64)
+
+        while solve_kernel.solve(board, options, empties, slots, candidates, marks, placed, removed, state):
+            self.cells[:] = board.tolist()
+            self.iteration_steps += int(state[4])
+            state[4] = 0
+            yield
+
+        # Search tree is exhausted, write the restored input numbers back to the solver cells.
+        self.cells[:] = board.tolist()
+        self.iteration_steps += int(state[4])
+
+    def _candidate_options(self):
+        """Return 81 candidate masks derived from the row, column and box bitmasks (0 for filled slots)."""
+        rows, cols, boxes = self.rows, self.cols, self.boxes
+        return [
+            0 if number else ~(rows[row] | cols[col] | boxes[box]) & 0x1FF
+            for number, (row, col, box) in zip(self.cells, CELL_INFO)
+        ]
+
+    def _redraw_dirty(self, force=False):
+        """Write all changed slots with a single write call, at most once per REDRAW_INTERVAL unless forced."""
+        now = time.monotonic()
+        if not force and now < self._next_redraw:
+            return
+
+        # Slots changed back to the number shown since the last redraw (e.g. tried and undone in between) are skipped.
+        # Each redraw is a frame boundary, so pass it through the print buffer to the terminal right away.
+        self._write_slots(self._dirty.items())
+        self._dirty.clear()
+        sys.stdout.flush()
+        self._next_redraw = now + REDRAW_INTERVAL
+
+    def _write_slots(self, slots):
+        """Write (slot index, number) pairs differing from the numbers shown in the terminal with a single write call."""
+        shown, slot_colors = self._shown, self.slot_colors
+        # Each write leaves the foreground color reset, so a reset color is only emitted after another color.
+        parts, color_shown, cursor_row, cursor_col = [CURSOR_SAVE], RESET_FORECOLOR, 0, 0
+        for idx, number in sorted(slots):
+            if shown[idx] == number:
+                continue
+            shown[idx] = number
+
+            # Color is only set if it differs from the previous slot written.
+            if slot_colors[idx] != color_shown:
+                color_shown = slot_colors[idx]
+                parts.append(color_shown)
+
+            # Slots are written in board order, so move the cursor right within a row instead of positioning it.
+            row, col, text = ROW_MAP[idx // 9], COL_MAP[idx % 9], str(number)
+            if row != cursor_row or col < cursor_col:
+                parts.append(SLOT_CURSOR[idx])
+            elif col > cursor_col:
+                parts.append(cursor_right(col - cursor_col))
+            parts.append(text)
+            cursor_row, cursor_col = row, col + len(text)
+
+        if len(parts) > 1:
+            parts.append(CURSOR_LOAD if color_shown == RESET_FORECOLOR else RESET_COLOR_AND_CURSOR)
+            sys.stdout.write("".join(parts))
+
+
+def enable_vt_mode():
+    """Enable ANSI escape sequence processing of the Windows console (no-op on other platforms)."""
+    console = win_console()
+    if console is None:
+        return
+
+    # Keep the current console mode and add ENABLE_VIRTUAL_TERMINAL_PROCESSING. Skipped if stdout is redirected.
+    kernel32, handle, mode = console
+    kernel32.SetConsoleMode(handle, mode | 0x0004)
 
 
 def parse_args():
@@ -143,7 +452,8 @@ def parse_args():
     parser = argparse.ArgumentParser()
     parser.add_argument("puzzlefile", help="File to the Sudoku puzzle to solve.", action="store")
     parser.add_argument("--space", help="Char used for free puzzle slots [Default: '.'].", action="store", default=".")
-    parser.add_argument("--interactive", help="Outputs each single step (may slowdown hard problems).", action="store_true")
+    parser.add_argument("--interactive", help="Shows solver steps merged into 5 ms frames.", action="store_true")
+    parser.add_argument("--compiled", help="Use compiled solver kernel if installed.", action="store_true")
     return parser.parse_args()
 
 
@@ -151,29 +461,33 @@ if __name__ == "__main__":
     # Parse command line arguments and quit program if required arguments are not specified.
     args = parse_args()
 
-    # Initialize terminal.
-    Terminal.initialize(forecolor=Colors.RESET, backcolor=Colors.RESET)
-
-    try:
-        # Initiate sudoko object and displays the puzzle specified via command line args.
-        sudoku = Sudoku(args)
-
-        # Prompt user to start the solver or to quit.
-        if input("\nPress [Enter] to solve the puzzle or (q) to quit: ").lower() == "q":
-            sys.exit()
-        sudoku.solve_puzzle()
-
-        # Print status message (move cursor down three rows to keep iteration number of last solution).
-        Cursor.down(pos=3)
-        if sudoku.solutions_found > 0 and not sudoku.board.all():
-            print(f"No further solution found. There exists {sudoku.solutions_found} solution(s) for the input puzzle.")
-            sudoku.set_board_numbers(board=sudoku.board_last_solution, inputs_only=False)
-        else:
-            print(f"Solver finished. Found {sudoku.solutions_found} solution(s) for the input puzzle.")
-
-    except KeyboardInterrupt:
-        pass
-
-    finally:
-        Cursor.enable()
-        Terminal.set_style(Styles.RESET)
+    # Collect terminal output in memory and write it in 64 KB chunks, flushed on user prompts, on each
+    # interactive redraw (frame boundary) and on exit.
+    with PrintBuffer(threshold=64 * 1024):
+        # Switch Windows console into VT mode once, then initialize terminal.
+        enable_vt_mode()
+        Terminal.initialize(forecolor=Colors.RESET, backcolor=Colors.RESET)
+
+        try:
+            # Initiate sudoko object and displays the puzzle specified via command line args.
+            sudoku = Sudoku(args)
+
+            # Prompt user to start the solver or to quit.
+            sys.stdout.flush()
+            if input("\nPress [Enter] to solve the puzzle or (q) to quit: ").lower() == "q":
+                sys.exit()
+            sudoku.solve_puzzle()
+
+            # Print status message (move cursor down three rows to keep iteration number of last solution).
+            sys.stdout.write(cursor_down(3))
+            if sudoku.solutions_found > 0 and 0 in sudoku.cells:
+                print(f"No further solution found. There exists {sudoku.solutions_found} solution(s) for the input puzzle.")
+                sudoku.set_board_numbers(board=sudoku.solution_board(sudoku.board_last_solution), inputs_only=False)
+            else:
+                print(f"Solver finished. Found {sudoku.solutions_found} solution(s) for the input puzzle.")
+
+        except (KeyboardInterrupt, _Stop):
+            pass
+
+        finally:
+            sys.stdout.write(CURSOR_ENABLE + RESET_ATTRIBUTES)